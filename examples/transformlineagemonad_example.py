@@ -1,5 +1,4 @@
 from openscad import *
-import functools
 
 nimport('https://raw.githubusercontent.com/wiw-pub/ztools/refs/heads/monads/src/ztools.py')
 nimport('https://raw.githubusercontent.com/wiw-pub/ztools/refs/heads/monads/src/transformlineagemonad.py')
@@ -49,16 +48,15 @@ class MonadUtilities:
         '''
         rotate_extrude makes origin the "center" of the result solid, but origin is set to identity matrix.
         
-        use center() move_vec as the delta translation matrix.
+        use the xy bounding box center (what center() would move by) as the delta translation matrix.
         '''
         res = solid.rotate_extrude(angle)
         
-        # center and axis_aligned only works on 3d solids. Raise the height to make it 3d to generate the delta transform matrix.
-        tmp = solid.linear_extrude(1)
-        tmp, move_vec = center(tmp, axis=[1, 1, 0])
-        _, move_vec2 = axis_aligned(tmp, axis=[0, 0, 1])
+        # bounding_box only works on 3d solids. Raise the height to make it 3d, only to read its xy extents.
+        mn, mx = bounding_box(solid.linear_extrude(1))
         
-        delta = multmatrix(to_matrix(move_vec), to_matrix(move_vec2))
+        # The delta is the pure translation centering the solid on xy. Extrusion starts at z=0, so no z component.
+        delta = to_matrix([-(mn[0] + mx[0]) / 2, -(mn[1] + mx[1]) / 2, 0])
         return TransformLineageMonad.ResultWithDelta(res, delta, [res])
     
 
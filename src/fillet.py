@@ -1,20 +1,31 @@
 from openscad import *
-import math
+import math, functools
 
-def bezier_curve(angle=90, heightLength=10, baseLength=10, fn=30):
+def _bezier_points(angle, heightLength, baseLength, fn):
+    '''
+    Numeric part of bezier_curve(): points along the height and along the base, no solids involved.
+    '''
     angle_rad = math.radians(angle)
 
     heightsIncrements = heightLength / fn
     baseIncrements = baseLength / fn
 
+    # Trig is evaluated once, not per point.
+    height_dx = heightsIncrements * math.cos(angle_rad)
+    height_dy = heightsIncrements * math.sin(angle_rad)
+
     # These are points along the height (y axis)
-    a = [[r * heightsIncrements * math.cos(angle_rad), r * heightsIncrements * math.sin(angle_rad)] for r in range(1, fn + 2)]
+    a = [[r * height_dx, r * height_dy] for r in range(1, fn + 2)]
 
     # These are points along the base (x axis).
     b = [[x * baseIncrements, 0] for x in range(fn, -1, -1)]
+    return a, b
 
-
-    poly = [polygon([[0, 0], a[i], b[i]]) for i in range(min(len(a), len(b)))]
+# Pure in its scalar arguments: repeated calls share the same solid.
+@functools.lru_cache(maxsize=128)
+def bezier_curve(angle=90, heightLength=10, baseLength=10, fn=30):
+    a, b = _bezier_points(angle, heightLength, baseLength, fn)
+    poly = [polygon([[0, 0], height_pt, base_pt]) for height_pt, base_pt in zip(a, b)]
     return union(poly)
 
 #show(bezier_curve())
\ No newline at end of file
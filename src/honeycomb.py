@@ -1,5 +1,6 @@
 from openscad import *
-import math, itertools, copy, functools
+import math, itertools
+from collections import OrderedDict
 
 # Prerequisites: Requires skin() feature to be ENABLED in Edit > Preferences > Features.
 
@@ -9,6 +10,9 @@ import math, itertools, copy, functools
 #   README.md has more info in the github repo that contains this file.
 import ztools as zt
 
+# Sheets kept per Honeycomb instance by fill_sheet().
+_SHEET_CACHE_SIZE = 64
+
 class Honeycomb:
     '''
     Lib for patterning a surface as hexagonal honeycomb.
@@ -17,21 +21,91 @@ class Honeycomb:
     '''
     def __init__(self, outer_radius=6, thickness=2):
         # Hexagon outer radius
-        self.outer_radius = outer_radius
+        self._outer_radius = outer_radius
 
         # Thickness of the hexagonal cell border.
-        self.thickness = thickness
+        self._thickness = thickness
+
+        # Invariant trig constants, in closed form instead of per call trig.
+        self._cos30 = math.sqrt(3) / 2
+        self._sin30 = 0.5
+        self._cos60 = 0.5
+        self._sin60 = self._cos30
+
+        self._update_geometry()
+
+    @property
+    def outer_radius(self):
+        return self._outer_radius
+
+    @outer_radius.setter
+    def outer_radius(self, value):
+        self._outer_radius = value
+        self._update_geometry()
+
+    @property
+    def thickness(self):
+        return self._thickness
+
+    @thickness.setter
+    def thickness(self, value):
+        self._thickness = value
+        self._update_geometry()
+
+    def _update_geometry(self):
+        '''
+        Recompute everything derived from outer_radius and thickness, and drop the memoized solids built from the old values.
+        '''
+        outer_radius, thickness = self._outer_radius, self._thickness
+
+        # center to side
+        outer_side_radius = outer_radius * self._cos30
+
+        # Double the center-to-side radius will get you edge-to-edge stack.
+        # Subtract the thickness for overlap. But wait: thickness is based on corner radius. Take a sin.
+        self._dist_r = (outer_side_radius * 2) - (2 * thickness * self._sin30)
+
+        # Where pair() places its second honeycomb, relative to the first.
+        self._pair_x_offset = self._dist_r * self._cos60
+        self._pair_y_offset = self._dist_r * self._sin60
+
+        # Extent of single(), known analytically. Saves meshing it to size a sheet.
+        self._single_width = 2 * outer_side_radius
+
+        # Corners of the outer and inner hexagon of single(), already in quadrant 1 touching both axes.
+        # offset(r=-thickness) moves every side inward by thickness, so the inner corner radius shrinks by thickness / cos(30).
+        # Once thickness fills the whole cell there is no inner hexagon (offset() would come out empty): None.
+        # A negative radius would instead give a point-reflected hexagon, so clamp.
+        inner_radius = max(outer_radius - thickness / self._cos30, 0)
+        self._outer_verts = self._hexagon_vertices(outer_radius, outer_radius)
+        self._inner_verts = self._hexagon_vertices(inner_radius, outer_radius) if inner_radius > 0 else None
+
+        # single(hole=True) is the inner hexagon alone, touching both axes on its own.
+        self._hole_verts = self._hexagon_vertices(inner_radius, inner_radius) if inner_radius > 0 else None
+
+        # Memoized single() and pair() results, keyed by hole.
+        # Solids are never modified in place (every operation returns a new solid), so callers can share them.
+        self._single_cache = {}
+        self._pair_cache = {}
+
+        # Memoized fill_sheet() results, keyed by (rounded x, rounded y, only_raw), least recently used first.
+        # Bounded: face_shell() asks for a sheet per distinct face size, and each sheet is a sizeable CSG tree.
+        self._sheet_cache = OrderedDict()
 
     def perpendicular_angle(self):
         '''
         Private utility method for finding perpendicular angle.
         '''
-        return math.cos(math.radians(30))
+        return self._cos30
 
     def pair(self, hole=False):
         '''
         Stitch two honeycombs together. It's not perfectly congruent but practically close enough.
         '''
+        key = bool(hole)
+        if key in self._pair_cache:
+            return self._pair_cache[key]
+
         a = self.single(hole)
 
 
@@ -44,65 +118,137 @@ class Honeycomb:
         b = a.translate([x_offset, y_offset, 0])
         res = a | b
         '''
-        
-        # center to corner
-        inner_corner_radius = -self.thickness + self.outer_radius
-        
-        # center to side
-        inner_side_radius = inner_corner_radius * math.cos(math.radians(180/6))
-        
-        outer_side_radius = self.outer_radius * math.cos(math.radians(180/6))
-        
-        # Double the center-to-side radius will get you edge-to-edge stack.
-        # Subtract the thickness for overlap. But wait: thickness is based on corner radius. Take a sin.
-        dist_r = (outer_side_radius * 2) - (2 * self.thickness * math.sin(math.radians(180/6)))
-        x_offset, y_offset = dist_r * math.cos(math.radians(2 * 180/6)), dist_r * math.sin(math.radians(2 * 180/6))
+
+        # Offsets are precomputed in __init__.
+        x_offset, y_offset = self._pair_x_offset, self._pair_y_offset
         b = a.translate([x_offset, y_offset, 0]).color('red')
         res = a | b
 
         # Also return offset distances.
-        return res, 2 * x_offset, 2 * y_offset
+        self._pair_cache[key] = (res, 2 * x_offset, 2 * y_offset)
+        return self._pair_cache[key]
 
     def single(self, hole=False):
         """
         Singular honeycomb.
         """
-        c = circle(r=self.outer_radius, fn=6)
-        inner = c.offset(r=-self.thickness, fn=6)
-        shell = c - inner if not hole else inner
+        key = bool(hole)
+        if key in self._single_cache:
+            return self._single_cache[key]
 
         # New implementation: hex is "standing" on a corner on x-axis.
-        shell = shell.rotz(360/6/2)
-        shell = projection(zt.axis_aligned(shell.linear_extrude(1), [1, 1, 0])[0])
+        # Closed-form polygons from corners precomputed in __init__, instead of circle(fn=6).rotz(30) and an offset() for the inner hex.
+        # Corners are already in quadrant 1, so no linear_extrude() + axis_aligned() + projection() round trip to reposition.
+        if self._inner_verts is None:
+            # No inner hexagon: a solid hexagon, and an empty hole (what offset(r=-thickness) gives).
+            outer = polygon(self._outer_verts)
+            shell = outer if not hole else outer.offset(r=-self.thickness)
+        elif not hole:
+            shell = polygon(self._outer_verts) - polygon(self._inner_verts)
+        else:
+            shell = polygon(self._hole_verts)
 
         # Old implementation: hex side is aligned on x-axis.
         # reposition to quadrant 1.
         #shell = shell.translate([self.outer_radius, self.outer_radius * self.perpendicular_angle(), 0])
+        self._single_cache[key] = shell
         return shell
 
+    def _hexagon_vertices(self, radius, align_radius):
+        '''
+        Private utility method for the corners of a hexagon standing on a corner.
+        Corners are at 30 + k * 60 degrees, spelled out in closed form: no trig, and exact values on the vertical axis.
+
+        The hexagon is centered where a hexagon of align_radius would touch both axes in quadrant 1: (align_radius * cos(30), align_radius).
+        '''
+        cx, cy = align_radius * self._cos30, align_radius
+        x, y = radius * self._cos30, radius * self._sin30
+        return [[cx + x, cy + y], [cx, cy + radius], [cx - x, cy + y], [cx - x, cy - y], [cx, cy - radius], [cx + x, cy - y]]
+
+    def _lattice_offsets(self, x, y):
+        '''
+        Private utility method for the numeric part of fill_sheet(): (x, y) offset of every cell touching the x by y sheet, no solids involved.
+
+        Returns [first sublattice offsets, second sublattice offsets].
+        '''
+        x_off, y_off = 2 * self._pair_x_offset, 2 * self._pair_y_offset
+
+        # Exact bounds: one more row/column than fits, the filter below drops the overshoot.
+        x_bound = math.ceil(x / x_off) + 1
+        y_bound = math.ceil(y / y_off) + 1
+
+        # Offsets per axis are computed once, instead of a multiply per tile per axis.
+        xs = [x_off * xx for xx in range(x_bound)]
+        ys = [y_off * yy for yy in range(y_bound)]
+
+        # Second sublattice sits where pair() puts its second honeycomb.
+        xs_b = [dx + self._pair_x_offset for dx in xs]
+        ys_b = [dy + self._pair_y_offset for dy in ys]
+
+        # Offsets are never negative. A cell touches the sheet iff it starts before the far edges.
+        # Cells entirely outside would only be trimmed away by the mask.
+        offsets_a = [(dx, dy) for dx, dy in itertools.product(xs, ys) if dx < x and dy < y]
+        offsets_b = [(dx, dy) for dx, dy in itertools.product(xs_b, ys_b) if dx < x and dy < y]
+        return [offsets_a, offsets_b]
+
+    def _lattice_cells(self, x, y):
+        '''
+        Private utility method pairing every lattice offset with the honeycomb placed there.
+        Second sublattice cells are red, like the second honeycomb of pair().
+        '''
+        shell = self.single()
+        offsets_a, offsets_b = self._lattice_offsets(x, y)
+        return [(shell, offsets_a), (shell.color('red'), offsets_b)]
+
+    def fill_sheet_raw(self, x, y):
+        """
+        Honeycombs covering a 2d sheet of x wide, y height, untrimmed and not unioned.
+
+        Returns a list of solids. For callers that further combine or transform the honeycombs, and can defer the union.
+        """
+        # Tile single honeycombs on two staggered sublattices, rather than tiling pair().
+        # Same placement as tiling pair(), without the a | b union inside every tile.
+        return [shell.translate([dx, dy, 0]) for shell, offsets in self._lattice_cells(x, y) for dx, dy in offsets]
+
     def fill_sheet(self, x, y, only_raw=False):
         """
         Fill a 2d sheet of x wide, y height with honeycombs.
 
         By default, the size is trimmed to the bounding sheet of dimensions x and y.
+        only_raw=True skips the trim. See fill_sheet_raw() to also skip the union.
+
+        Memoized per instance (last 64 sheets): asking for the same sheet again returns the same solid.
+        Sizes are matched to 3 decimal places, like face_shell()'s sheet reuse.
         """
+        key = (round(x, 3), round(y, 3), bool(only_raw))
+        sheet = self._sheet_cache.get(key)
+        if sheet is not None:
+            self._sheet_cache.move_to_end(key)
+            return sheet
+
+        sheet = self._sheet_cache[key] = self._build_sheet(x, y, only_raw)
+        if len(self._sheet_cache) > _SHEET_CACHE_SIZE:
+            self._sheet_cache.popitem(last=False)
+        return sheet
+
+    def _build_sheet(self, x, y, only_raw):
+        if only_raw:
+            return union(self.fill_sheet_raw(x, y))
+
+        # Only cells crossing the sheet border need trimming. Cells fully inside skip the mask intersection.
+        # Same tiling as fill_sheet_raw().
+        cell_w, cell_h = self._single_width, 2 * self.outer_radius
+        interior, edge = [], []
+        for shell, offsets in self._lattice_cells(x, y):
+            for dx, dy in offsets:
+                cell = shell.translate([dx, dy, 0])
+                if dx + cell_w <= x and dy + cell_h <= y:
+                    interior.append(cell)
+                else:
+                    edge.append(cell)
 
         mask = square([x, y])
-
-        # Upper bound generate combs.
-        _, y_mag, _ = zt.magnitudes(self.pair()[0].linear_extrude(1))
-        x_mag, _, _ = zt.magnitudes(self.single().linear_extrude(1))
-        sheet = []
-        
-        # Lazy overage.
-        x_bound = math.ceil(x/x_mag * 1.5)
-        y_bound = math.ceil(y/y_mag * 1.5)
-        
-        shell, x_off, y_off = self.pair()
-        for xx, yy in itertools.product(range(x_bound), range(y_bound)):
-            sheet.append(shell.translate([x_off * xx, y_off * yy, 0]))
-            
-        return mask & union(sheet) if not only_raw else union(sheet)
+        return union(interior + [mask & union(edge)])
 
     
     def face_shell(self, solid, extrude_thickness, enable_border=True):
@@ -118,6 +264,11 @@ class Honeycomb:
 
         shell_faces = []
         borders = []
+
+        # Centered, extruded honeycomb sheets keyed by (rounded) sheet dimensions.
+        # Many solids have repeated face sizes (e.g., all 6 faces of a cube), and the sheet is the expensive part.
+        sheet_cache = {}
+
         for i, f in enumerate(solid.faces()):
             # Track the move vector from origin.
             # This is important to "restore" orientation after manipulation at the origin.
@@ -138,42 +289,40 @@ class Honeycomb:
             x_mag, y_mag, _ = zt.magnitudes(flat_face_3d)
 
             # Hack: For some triangles, the x_mag, y_mag gets cut off. 2x it as a quick hack to ensure honeycomb sheet can encompass the whole face.
-            replacement_face_3d = zt.center(self.fill_sheet(x_mag * 2, y_mag * 2).linear_extrude(extrude_thickness))[0]
+            sheet_x, sheet_y = x_mag * 2, y_mag * 2
 
-            # Make sure the honeycomb sheet is "below ground" to have final shape extrude inward.
-            replacement_face_3d = replacement_face_3d.down(extrude_thickness/2)
+            sheet_key = (round(sheet_x, 3), round(sheet_y, 3))
+            if sheet_key not in sheet_cache:
+                # fill_sheet() spans [0, sheet_x] x [0, sheet_y] by construction, so center it analytically.
+                # zt.center() would have to mesh() the whole honeycomb sheet just to read back its bounding box.
+                # Also push it "below ground" (extrude_thickness) in the same move, to have final shape extrude inward.
+                sheet_cache[sheet_key] = self.fill_sheet(sheet_x, sheet_y).linear_extrude(extrude_thickness).translate([-sheet_x / 2, -sheet_y / 2, -extrude_thickness])
+            replacement_face_3d = sheet_cache[sheet_key]
 
             # Intersect the volume to "fit" the rectangular honeycomb sheet to the face dimensions.
             # Necessary for non-rectangular faces.
             replacement_face_3d &= flat_face_3d
 
 
-            def old_border_impl(replacement_face_3d, flat_face_3d):
-                # NOTE: Because the face will be flat on xy-plane with no Z difference, we only need to shrink in xy directions.
-                # Learning from /u/gadget3D: larger "cut" mask fixes z-fighting. Make delta-z positive, not zero.
-                inner = zt.offset_3d(flat_face_3d, delta=[-extrude_thickness, -extrude_thickness, extrude_thickness])
+            def border_impl(replacement_face_3d, flat_face_3d):
+                '''
+                From /u/gadget3D's suggestion to fix z-fighting.
+                The face is flat on xy-plane, so shrink it in 2d: a 2d offset() is much cheaper than offset_3d() + 3d difference.
+                '''
+                # The over extrusion on the cut fixes z-fighting problems.
+                border_cut = flat_face_3d.projection().offset(-extrude_thickness).linear_extrude(extrude_thickness*3).down(1.5*extrude_thickness)
+                border = flat_face_3d - border_cut
 
-                border = flat_face_3d - inner
-        
                 # For debugging: add the border to collection.
                 borders.append(border)
-        
+
                 # Apply the border.
                 return replacement_face_3d | border
-            
-            def new_border_impl(replacement_face_3d, flat_face_3d):
-                '''
-                From /u/gadget3D's suggestion to fix z-fighting??
-                '''
-                # The over extrusion on the cut fixes z-fighting problems.
-                border_cut = flat_face_3d.projection().offset(-extrude_thickness).linear_extrude(extrude_thickness*3).down(1.5*extrude_thickness)
-                border_frame = flat_face_3d - border_cut
-                return replacement_face_3d | border_frame
 
             # If border is enabled: prep the border to be unioned later.
-            if enable_border:                
-                replacement_face_3d = old_border_impl(replacement_face_3d, flat_face_3d)
-                #replacement_face_3d = new_border_impl(replacement_face_3d, flat_face_3d)
+            # A non-positive thickness leaves no border to add.
+            if enable_border and extrude_thickness > 0:
+                replacement_face_3d = border_impl(replacement_face_3d, flat_face_3d)
 
 
             # Restored to original orientation
@@ -210,14 +359,23 @@ class Honeycomb:
             return s
         
 
-        def ring_holes():
-            _, x_offset, y_offset = self.pair()
+        # Same offsets pair() returns, without building a pair just to read them.
+        x_offset, y_offset = 2 * self._pair_x_offset, 2 * self._pair_y_offset
 
+        def ring_holes():
             holes_3d = perfect_holes().linear_extrude(shell_thickness * 2)
-            holes_3d_centers = holes_3d.left(x_offset/2 + self.thickness)
 
-            # Offset the radius distance, but make sure the extrude points 'inward'.
-            pre_ring = holes_3d_centers.rotx(90).rotz(90).right(radius - shell_thickness)
+            # Same as holes_3d.left(a).rotx(90).rotz(90).right(b), folded into one exact matrix:
+            # center the holes (left a), stand them up facing +x, and offset the radius distance so the extrude points 'inward' (right b).
+            # (x, y, z) -> (z + b, x - a, y)
+            a = x_offset/2 + self.thickness
+            b = radius - shell_thickness
+            pre_ring = holes_3d.multmatrix([
+                [0, 0, 1, b],
+                [1, 0, 0, -a],
+                [0, 1, 0, 0],
+                [0, 0, 0, 1]
+            ])
 
             # Need some math to calculate the angle to rotz, since it is based off of radius (cord distance calculation).
             # Just do triangle math. tan() would do.
@@ -226,19 +384,17 @@ class Honeycomb:
             ang_deg = math.degrees(ang_radian)
             
             floor_limit = int(360 // ang_deg)
-            ring = []
-            for i in range(floor_limit):
-                ring.append(pre_ring.rotz(i * ang_deg))
+            ring = [pre_ring.rotz(i * ang_deg) for i in range(floor_limit)]
 
             return union(ring)
 
 
         def column_holes():
-            _, x_offset, y_offset = self.pair()
             height_limit = math.ceil(height/y_offset)
-            column = []
-            for j in range(height_limit):
-                column.append(ring_holes().up(j * y_offset))
+
+            # Every layer is the same ring, only raised. Build it once.
+            ring = ring_holes()
+            column = [ring.up(j * y_offset) for j in range(height_limit)]
 
             return union(column)
 
@@ -1,12 +1,20 @@
 from openscad import *
+import math
 
 def ngon(filletRadius=1, nSides=6, radius=10):
     """
     Create a n-gon shape by setting up vertices and hull them.
     """
+    # Same as right(radius).rotz(deg), folded into one multmatrix per vertex.
+    # The rotation is kept, so every fillet circle's facets turn with its vertex (n-fold symmetric at low resolution).
+    step = 2 * math.pi / nSides
     vertices = []
     for i in range(1, nSides+1):
-        deg = i * 360 / nSides
-        c = circle(r=filletRadius).right(radius).rotz(deg)
-        vertices.append(c)
+        c, s = math.cos(i * step), math.sin(i * step)
+        vertices.append(circle(r=filletRadius).multmatrix([
+            [c, -s, 0, radius * c],
+            [s, c, 0, radius * s],
+            [0, 0, 1, 0],
+            [0, 0, 0, 1]
+        ]))
     return hull(union(vertices))
\ No newline at end of file
@@ -6,7 +6,67 @@ from dataclasses import dataclass, field
 from openscad import *
 
 
-@dataclass
+# 4x4 identity matrix, i.e. "no movement". Shared: treat as read-only.
+# Cheaper than building a primitive just to read its origin (e.g., cube(1).origin).
+IDENTITY4 = [
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 1, 0],
+    [0, 0, 0, 1]
+]
+
+
+def _matmul(left, right):
+    '''
+    Plain 4x4 matrix product (left x right) on nested lists, without going through a solid.
+    '''
+    cols = list(zip(*right))
+    return [[sum(a * b for a, b in zip(row, col)) for col in cols] for row in left]
+
+
+def _translation_delta(after, before):
+    '''
+    divmatrix(after, before) for the common case where neither matrix rotates or scales (3x3 part is identity).
+    The delta is then just the difference of the translation columns.
+    Returns None if either matrix is not a pure translation.
+    '''
+    for matrix in (after, before):
+        for i in range(3):
+            row = matrix[i]
+            for j in range(3):
+                if row[j] != (1 if i == j else 0):
+                    return None
+        if matrix[3][:3] != [0, 0, 0]:
+            return None
+
+    return [
+        [1, 0, 0, after[0][3] - before[0][3]],
+        [0, 1, 0, after[1][3] - before[1][3]],
+        [0, 0, 1, after[2][3] - before[2][3]],
+        [0, 0, 0, 1]
+    ]
+
+
+@dataclass(slots=True)
+class ResultWithDelta:
+    '''
+    Typed result that transform_func can return, which allows overriding transform_matrix tracking behavior.
+    Also reachable as TransformLineageMonad.ResultWithDelta.
+    '''
+    result_solid: Openscad
+    delta_transform_matrix: List[List[float]]
+    transform_func_results: List[Any]
+
+    @staticmethod
+    def override_delta_noop(func_takes_solid_as_arg):
+        '''
+        Convenient function to override delta_transform_matrix with identity matrix.
+        It's so common for vanilla pythonscad functions to return a solid with .origin as identity matrix, which causes divmatrix() to generate non-zero translate/rotate/scale when in reality, the solid has not moved! 
+        '''
+        return lambda solid: ResultWithDelta(func_takes_solid_as_arg(solid), IDENTITY4, [])
+
+
+@dataclass(slots=True)
 class TransformLineageMonad:
     '''
     Monad for tracking lineage of transformation (e.g., 4x4 transformation matrix, commonly used in computer graphics and robotics forward/inverse kinematics).
@@ -25,65 +85,55 @@ class TransformLineageMonad:
     # This solely exists, because some solid's origin is not trustworthy due to diff/union resetting origin despite we logically "track" it thru transformation_stack.
     # Have this "cached" compute is an optimization over performing multmatrix() thru transformation_stack all the time.
     #combined_origin: list[list[float]] = field(default_factory = lambda : cube(1).origin)
-    combined_origin: list[list[float]] = field(default_factory = list)
+    combined_origin: list[list[float]] | None = None
     
     '''
     Stack of transformations to end in this solid.
     If not provided, init with identity matrix.
     '''
     #transformation_stack: list[list[list[float]]] = field(default_factory = lambda : [cube(1).origin])
-    transformation_stack: list[list[list[float]]] = field(default_factory = list)
+    transformation_stack: list[list[list[float]]] | None = None
 
     __checkpoint: int = 1
 
+    # combined_origin as it was before each apply_mutably(), i.e. the prefix products of transformation_stack.
+    # Aligned with the top of transformation_stack: undo_mutably() pops and restores in O(1) instead of a divmatrix().
+    # Stack entries that predate this instance (passed to the constructor) have no prefix here, and fall back to divmatrix().
+    __prefix_origins: list[list[list[float]]] = field(default_factory = list, init = False, repr = False)
+
     def __post_init__(self):
-        if not self.combined_origin:
+        # None means "not provided". An explicitly passed (e.g., cloned) empty stack stays empty.
+        if self.combined_origin is None:
             self.combined_origin = self.solid.origin
-        if not self.transformation_stack:
-            self.transformation_stack.append(self.solid.origin)
+        if self.transformation_stack is None:
+            self.transformation_stack = [self.solid.origin]
     
-    @dataclass
-    class ResultWithDelta:
-        '''
-        Typed result that transform_func can return, which allows overriding transform_matrix tracking behavior.
-        '''
-        result_solid: Openscad
-        delta_transform_matrix: List[List[float]]
-        transform_func_results: List[Any]
-
-        @staticmethod
-        def override_delta_noop(func_takes_solid_as_arg):
-            '''
-            Convenient function to override delta_transform_matrix with identity matrix.
-            It's so common for vanilla pythonscad functions to return a solid with .origin as identity matrix, which causes divmatrix() to generate non-zero translate/rotate/scale when in reality, the solid has not moved! 
-            '''
-            return lambda solid: TransformLineageMonad.ResultWithDelta(func_takes_solid_as_arg(solid), cube(1).origin, [])
+    # Kept reachable from the class for existing callers. Not a field (no annotation).
+    ResultWithDelta = ResultWithDelta
 
     def clone(self) -> TransformLineageMonad:
         '''
         Deep clone of this TransformLineageMonad instance.
         Clones transformation_stack entirely.
         '''
-        new_stack = []
-        for matrix in self.transformation_stack:
-            new_stack.append([row[:] for row in matrix])
-        
+        # Row slices are enough: the matrices hold immutable numbers.
+        new_stack = [[row[:] for row in matrix] for matrix in self.transformation_stack]
         new_origin = [row[:] for row in self.combined_origin]
-                
-        return TransformLineageMonad(self.solid, new_origin, new_stack)
+
+        twin = TransformLineageMonad(self.solid, new_origin, new_stack)
+        twin.__prefix_origins = [[row[:] for row in matrix] for matrix in self.__prefix_origins]
+        return twin
         
-    def undo_mutably(self) -> TransformLineageMonad:
+    def undo_mutably(self, count=1) -> TransformLineageMonad:
         '''
-        Mutably unwind a transformation top of stack.
+        Mutably unwind count transformations (default 1) from top of stack.
         Reassigns self.solid, and modifies transformation_stack.
+        Undoing several at once costs a single transform on the solid, so prefer undo_mutably(n) over n calls.
         '''
         if not self.transformation_stack:
             raise IndexError('transformation stack is empty. Cannot undo_mutably()')
         
-        evict = self.transformation_stack.pop()
-        
-        self.combined_origin = divmatrix(self.combined_origin, evict)
-        self.solid = self.solid.divmatrix(evict)
+        self.__unwind(count)
         return self
     
     def apply_mutably(self, transform_func: Callable[[Openscad], Openscad | List[Any] | ResultWithDelta]) -> TransformLineageMonad | Tuple[TransformLineageMonad, List[Any]]:
@@ -102,15 +152,29 @@ class TransformLineageMonad:
         override_delta_transform_matrix = None
         
         # No method overloading in Python. Do scala style structural matching.
-        if isinstance(post_transform, Openscad):
+        # Exact type identity checks first (no MRO walk). Native solids and plain ResultWithDelta are the common cases.
+        # Subclasses of either fall through to the isinstance() checks below.
+        post_transform_type = type(post_transform)
+        if post_transform_type is Openscad:
             is_native = True
             replacement = post_transform
-                
-        elif isinstance(post_transform, self.ResultWithDelta):
+
+        elif post_transform_type is ResultWithDelta:
             
             replacement = post_transform.result_solid
             override_delta_transform_matrix = post_transform.delta_transform_matrix
             post_transform = post_transform.transform_func_results
+
+        elif isinstance(post_transform, Openscad):
+            # Anything deriving from Openscad.
+            is_native = True
+            replacement = post_transform
+
+        elif isinstance(post_transform, ResultWithDelta):
+            # Anything deriving from ResultWithDelta.
+            replacement = post_transform.result_solid
+            override_delta_transform_matrix = post_transform.delta_transform_matrix
+            post_transform = post_transform.transform_func_results
             
         else:
             replacement = post_transform[0]
@@ -119,6 +183,7 @@ class TransformLineageMonad:
         delta = self.__component_matrix(replacement) if not override_delta_transform_matrix else override_delta_transform_matrix
         
         self.transformation_stack.append(delta)
+        self.__prefix_origins.append(self.combined_origin)
         self.combined_origin = multmatrix(self.combined_origin, delta)
         self.solid = replacement
 
@@ -128,7 +193,11 @@ class TransformLineageMonad:
         return self.__checkpoint
         
     def __component_matrix(self, replacement):
-        return divmatrix(replacement.origin, self.combined_origin)
+        after = replacement.origin
+
+        # Pure translations (up/right/back, etc.) skip the general divmatrix().
+        delta = _translation_delta(after, self.combined_origin)
+        return delta if delta is not None else divmatrix(after, self.combined_origin)
     
     def __component_matrix_naive(self, before, after) -> List[List[float]]:
         '''
@@ -155,7 +224,29 @@ class TransformLineageMonad:
          
         # unwind transformations
         count = len(self.transformation_stack) - self.__checkpoint
-        for _ in range(count):
-            self.undo_mutably()
+        if count > 0:
+            self.undo_mutably(count)
          
-        return True
\ No newline at end of file
+        return True
+
+    def __unwind(self, count):
+        '''
+        Pop count transformations, but apply a single divmatrix() to the solid.
+        Undoing D_n, then D_n-1, ... one by one is the same as undoing their product (D_n x D_n-1 x ...) once.
+        '''
+        if count > len(self.transformation_stack):
+            raise IndexError(f'cannot unwind {count} transformations from a stack of {len(self.transformation_stack)}')
+
+        composite = None
+        for _ in range(count):
+            evict = self.transformation_stack.pop()
+
+            if self.__prefix_origins:
+                self.combined_origin = self.__prefix_origins.pop()
+            else:
+                self.combined_origin = divmatrix(self.combined_origin, evict)
+
+            composite = evict if composite is None else _matmul(composite, evict)
+
+        if composite is not None:
+            self.solid = self.solid.divmatrix(composite)
\ No newline at end of file
@@ -1,9 +1,10 @@
 from openscad import *
 
 import math, heapq
+from collections import OrderedDict
 from collections.abc import Iterable
 
-from transformlineagemonad import TransformLineageMonad
+from transformlineagemonad import TransformLineageMonad, IDENTITY4
 
 nimport('https://raw.githubusercontent.com/wiw-pub/ztools/refs/heads/main/src/transformlineagemonad.py')
 
@@ -12,27 +13,111 @@ WIP: generalized set of operators for higher-level abstraction for pythonscad.
 '''
 
 
-def bounding_box(solid):
+# Memoized bounding boxes: id(solid) -> (solid, mn, mx), least recently used first.
+# Solids are never modified in place (every operation returns a new solid), so an entry never goes stale.
+# The entry holds on to the solid itself, so its id() cannot be reused by another object while cached.
+_BBOX_CACHE = OrderedDict()
+_BBOX_CACHE_SIZE = 256
+
+def set_bbox_cache(solid, mn, mx):
+    '''
+    Seed bounding_box()'s cache with a known bounding box, so it never needs to mesh() the solid.
+    Use when the bounds are known by construction, e.g.:
+        box = cube([10, 20, 5])
+        set_bbox_cache(box, [0, 0, 0], [10, 20, 5])
+
+    The caller vouches for the numbers: they are not checked against the geometry.
+    '''
+    _BBOX_CACHE[id(solid)] = (solid, tuple(mn), tuple(mx))
+    _BBOX_CACHE.move_to_end(id(solid))
+    if len(_BBOX_CACHE) > _BBOX_CACHE_SIZE:
+        _BBOX_CACHE.popitem(last=False)
+
+# Memoized meshes for get_mesh(): id(solid) -> (solid, mesh). Same scheme as _BBOX_CACHE, kept smaller since meshes are big.
+_MESH_CACHE = OrderedDict()
+_MESH_CACHE_SIZE = 16
+
+def get_mesh(solid):
+    '''
+    solid.mesh(), memoized per solid object.
+    Use it to share one mesh evaluation across several mesh consumers, e.g.:
+        mesh = get_mesh(solid)
+        mn, mx = bounding_box(solid, mesh=mesh)
+        coords = debug_face_coordinates(solid, mesh=mesh)
+
+    Returns (vertices, faces). Treat it as read-only: it is shared with other callers.
     '''
-    Returns bounding box as a 2-element list of (x, y, z) coordinates.
+    entry = _MESH_CACHE.get(id(solid))
+    if entry is not None and entry[0] is solid:
+        _MESH_CACHE.move_to_end(id(solid))
+        return entry[1]
+
+    mesh = solid.mesh()
+    _MESH_CACHE[id(solid)] = (solid, mesh)
+    if len(_MESH_CACHE) > _MESH_CACHE_SIZE:
+        _MESH_CACHE.popitem(last=False)
+    return mesh
+
+def bounding_box(solid, mesh = None):
+    '''
+    Returns bounding box as a 2-element list of (x, y, z) tuples.
     mn is the "minimum" coordinate, and mx is the "maximum" coordinate.
+    The tuples are immutable and hashable, so they are safe to share and usable as dict/cache keys.
+
+    Memoized per solid object: asking again for the same solid skips the mesh() evaluation.
+    Optionally: supply mesh (as returned by solid.mesh() or get_mesh()) to avoid evaluating it again.
     '''
-    vertices, _ = solid.mesh()
-    mn = [min(transpose) for transpose in zip(*vertices)]
-    mx = [max(transpose) for transpose in zip(*vertices)]
+    entry = _BBOX_CACHE.get(id(solid))
+    if entry is not None and entry[0] is solid:
+        _BBOX_CACHE.move_to_end(id(solid))
+        # The tuples are immutable: hand out the cached ones directly.
+        return [entry[1], entry[2]]
+
+    if mesh is None:
+        # Reuse a mesh get_mesh() already holds. Otherwise mesh without caching it: the bbox alone is what gets kept.
+        entry = _MESH_CACHE.get(id(solid))
+        mesh = entry[1] if entry is not None and entry[0] is solid else solid.mesh()
+    vertices, _ = mesh
+
+    mn, mx = bounding_box_from_vertices(vertices)
+    set_bbox_cache(solid, mn, mx)
     return [mn, mx]
 
+def bounding_box_from_vertices(vertices):
+    '''
+    Bounding box of a list of (x, y, z) vertices (e.g., the first element of solid.mesh()), without needing the solid.
+    Same return form as bounding_box(). Not cached: there is no solid to key on.
+    '''
+    # Transpose once into per-axis columns, then reduce each column with the C-level min()/max().
+    columns = list(zip(*vertices))
+    mn = tuple(min(column) for column in columns)
+    mx = tuple(max(column) for column in columns)
+    return [mn, mx]
+
+def translated_bbox(mn, mx, vec):
+    '''
+    Bounding box after moving a solid by vec: both corners shift by vec. No mesh() needed.
+    Returns [mn, mx] as tuples, like bounding_box().
+    '''
+    return [tuple(a + v for a, v in zip(mn, vec)), tuple(b + v for b, v in zip(mx, vec))]
+
 def bounding_box_cube(solid, mn = None, mx = None):
     '''
     Bounding box as a cube.
     Optionally: supply mn and mx to avoid recomputing bounding box. See bounding_box() for more details.
     '''
-    if not mn or not mx:
+    if mn is None or mx is None:
         mn, mx = bounding_box(solid)
 
+    # A corner-anchored cube moved to the low corner is the same box as a centered cube moved to the bbox center.
+    # Per-axis min(), so caller supplied mn/mx that are not ordered on some axis still give the same box.
+    lows = [min(a, b) for a, b in zip(mn, mx)]
     lengths = [abs(b - a) for a, b in zip(mn, mx)]
-    center_vector = [(b + a) / 2 for a, b in zip(mn, mx)]
-    return cube(lengths, center=True).translate(center_vector)
+    res = cube(lengths).translate(lows)
+
+    # The box is the bounding box by construction: seed the cache so a later bounding_box(res) skips mesh().
+    set_bbox_cache(res, lows, [a + length for a, length in zip(lows, lengths)])
+    return res
 
 def bounding_box_volume(solid, mn = None, mx = None):
     '''
@@ -40,7 +125,7 @@ def bounding_box_volume(solid, mn = None, mx = None):
 
     Optionally: supply mn and mx to avoid recomputing bounding box. See bounding_box() for more details.
     '''
-    if not mn or not mx:
+    if mn is None or mx is None:
         mn, mx = bounding_box(solid)
 
     mag_x, mag_y, mag_z = magnitudes(solid, mn, mx)
@@ -55,11 +140,18 @@ def center(solid, axis = [1, 1, 1], mn = None, mx = None):
 
     Returns [solid at origin, move_vector used to move the solid to origin]
     '''
-    if not mn or not mx:
+    measured = mn is None or mx is None
+    if measured:
         mn, mx = bounding_box(solid)
 
     move_vector = [-(sum(dims) / 2) if axis[axis_idx] == 1 else 0 for axis_idx, dims in enumerate(zip(mn, mx))]
-    return [solid.translate(move_vector), move_vector]
+    res = solid.translate(move_vector)
+
+    # The moved bbox is known: seed the cache so a later bounding_box(res) skips mesh().
+    # Only for bounds measured here. Caller supplied mn/mx may deliberately differ from the mesh (e.g., a subregion).
+    if measured:
+        set_bbox_cache(res, *translated_bbox(mn, mx, move_vector))
+    return [res, move_vector]
 
 def offset_3d(solid, delta = [1, 1, 1], auto_center=True, mn = None, mx = None):
     '''
@@ -69,20 +161,44 @@ def offset_3d(solid, delta = [1, 1, 1], auto_center=True, mn = None, mx = None):
     Delta acts like a "radius". E.g., Delta of [1, 0, 0] grows 2 in total in x dimension.
     Returns the resized shape.
     '''
-    if not mn or not mx:
+    measured = mn is None or mx is None
+    if measured:
         mn, mx = bounding_box(solid)
 
     x_mag, y_mag, z_mag = magnitudes(solid, mn, mx)
     dx, dy, dz = delta
 
+    # delta is apply on "all sides".
+    new_mags = [(x_mag + 2 * dx), (y_mag + 2 * dy), (z_mag + 2 * dz)]
+
+    # resize() fits the bbox exactly, so it is a per-axis scale by new / old.
+    # When auto centering, fold "move to origin, resize, move back" into a single matrix: scale about the bbox center.
+    # resize() treats 0 as "keep this dimension", and a flat axis can't be scaled: those cases take the general path below.
+    # Only for bounds measured here: resize() scales by the real mesh extents, which caller supplied mn/mx may not match.
+    old_mags = (x_mag, y_mag, z_mag)
+    if measured and auto_center and all(m > 0 for m in old_mags) and all(m > 0 for m in new_mags):
+        scales = [new / old for new, old in zip(new_mags, old_mags)]
+        mid = [(a + b) / 2 for a, b in zip(mn, mx)]
+        sx, sy, sz = scales
+        cx, cy, cz = [c * (1 - s) for c, s in zip(mid, scales)]
+        res = solid.multmatrix([
+            [sx, 0, 0, cx],
+            [0, sy, 0, cy],
+            [0, 0, sz, cz],
+            [0, 0, 0, 1]
+        ])
+
+        # The center is unchanged and the extents are new_mags: seed the cache so a later bounding_box(res) skips mesh().
+        set_bbox_cache(res, [c - m / 2 for c, m in zip(mid, new_mags)], [c + m / 2 for c, m in zip(mid, new_mags)])
+        return res
+
     # Because resize is performed in respect to origin, we need to move the solid to origin first, transform, and restore back to its original position.
     # Do this if auto_center=True.
     at_origin = solid
     if auto_center:
         at_origin, move_vector_used = center(solid, mn=mn, mx=mx)
 
-    # delta is apply on "all sides".
-    resized = at_origin.resize([(x_mag + 2 * dx), (y_mag + 2 * dy), (z_mag + 2 * dz)])
+    resized = at_origin.resize(new_mags)
 
     # Restored to original position.
     res = resized
@@ -97,30 +213,8 @@ def __old__axis_aligned(solid, axis = [0, 0, 1], mn = None, mx = None):
     Works for negative axis for "below" alignment.
     Will downscale with fractions in axis, but that's not necessarily intended.
     '''
-    if not mn or not mx:
-        mn, mx = bounding_box(solid)
-
-    if any([abs(a) > 1 for a in axis]):
-        raise Exception("Each axis argument must be in the inclusive range of [-1, 1]")
-
-    # Move the solid in the positive direction of the axis, such that the minimum bounds touch the axis zeroes.
-    ops = (
-        lambda s, minimums: s.right(-minimums),
-        lambda s, minimums: s.back(-minimums),
-        lambda s, minimums: s.up(-minimums),
-    )
-
-    # Move the solid in the negative direction of the axis, such that the maximum bounds touch the axis zeroes.
-    neg_ops = (
-        lambda s, maximums: s.left(maximums),
-        lambda s, maximums: s.front(maximums),
-        lambda s, maximums: s.down(maximums),
-    )
-
-    res = solid
-    for op, neg_op, minimums, maximums, ax in zip(ops, neg_ops, mn, mx, axis):
-        res = op(res, minimums * ax) if ax >= 0 else neg_op(res, maximums * -ax)
-    return res
+    # Same per-axis moves, folded into the single translate of axis_aligned().
+    return axis_aligned(solid, axis, mn, mx)[0]
 
 
 def axis_aligned(solid, axis = [0, 0, 1], mn = None, mx = None):
@@ -129,38 +223,32 @@ def axis_aligned(solid, axis = [0, 0, 1], mn = None, mx = None):
     Works for negative axis for "below" alignment.
     Will downscale with fractions in axis, but that's not necessarily intended.
     
+    Optionally: supply mn and mx to avoid recomputing bounding box. See bounding_box() for more details.
+    Only the bounds the axis needs are required: mn for positive axes, mx for negative axes (e.g., z_aligned() only needs mn).
+
     Returns: [aligned_solid, move_vec]
     '''
-    
-    if not mn or not mx:
+    if any(abs(a) > 1 for a in axis):
+        raise Exception("Each axis argument must be in the inclusive range of [-1, 1]")
+
+    needs_mn = any(a > 0 for a in axis)
+    needs_mx = any(a < 0 for a in axis)
+    measured = (needs_mn and mn is None) or (needs_mx and mx is None)
+    if measured:
         mn, mx = bounding_box(solid)
 
-    if any([abs(a) > 1 for a in axis]):
-        raise Exception("Each axis argument must be in the inclusive range of [-1, 1]")
+    # Per axis:
+    #   Positive direction: move such that the minimum bounds touch the axis zeroes. -(mn * ax)
+    #   Negative direction: move such that the maximum bounds touch the axis zeroes. -(mx * -ax)
+    #   Zero: no movement.
+    final_move_vec = [-(mn[i] * ax) if ax > 0 else mx[i] * ax if ax < 0 else 0 for i, ax in enumerate(axis)]
+    res = solid.translate(final_move_vec)
 
-    # translate vector for the solid in the positive direction of the axis, such that the minimum bounds touch the axis zeroes.
-    ops = (
-        lambda s, minimums: [-minimums, 0, 0],
-        lambda s, minimums: [0, -minimums, 0] ,
-        lambda s, minimums: [0, 0, -minimums],
-    )
-
-    # translate vector for the solid in the negative direction of the axis, such that the maximum bounds touch the axis zeroes.
-    neg_ops = (
-        lambda s, maximums: [-maximums, 0, 0],
-        lambda s, maximums: [0, -maximums, 0],
-        lambda s, maximums: [0, 0, -maximums],
-    )
-
-    component_vectors = []
-    for op, neg_op, minimums, maximums, ax in zip(ops, neg_ops, mn, mx, axis):
-        partial_vec = op(solid, minimums * ax) if ax >= 0 else neg_op(solid, maximums * -ax)
-        component_vectors.append(partial_vec)
-        
-    # reduce the component vector to final vector.
-    final_move_vec = [sum(*dims) for dims in zip(component_vectors)]
-    
-    return [solid.translate(final_move_vec), final_move_vec]
+    # The moved bbox is known: seed the cache so a later bounding_box(res) skips mesh().
+    # Only for bounds measured here. Caller supplied mn/mx may deliberately differ from the mesh (e.g., a subregion).
+    if measured:
+        set_bbox_cache(res, *translated_bbox(mn, mx, final_move_vec))
+    return [res, final_move_vec]
 
 def z_aligned(solid, mn = None, mx = None):
     '''
@@ -177,13 +265,19 @@ def z_aligned(solid, mn = None, mx = None):
 
     TODO: Upgrade to return [moved_solid, move_vec].
     '''
-    # if not mn:
-    #     mn, _ = bounding_box(solid)
+    # Single axis: only the z minimum is needed. Skip axis_aligned()'s general per-axis move vector.
+    measured = mn is None
+    if measured:
+        mn, mx = bounding_box(solid)
 
-    # _, _, z = mn
-    # return solid.up(-z)
+    z = mn[2]
+    res = solid.up(-z)
 
-    return axis_aligned(solid, axis = [0, 0, 1], mn=mn, mx=mx)[0]
+    # The moved bbox is known: seed the cache so a later bounding_box(res) skips mesh().
+    # Only for bounds measured here. Caller supplied mn/mx may deliberately differ from the mesh (e.g., a subregion).
+    if measured:
+        set_bbox_cache(res, *translated_bbox(mn, mx, [0, 0, -z]))
+    return res
 
 def xy_aligned(solid, mn = None, mx = None):
     '''
@@ -200,7 +294,7 @@ def magnitudes(solid, mn = None, mx = None):
 
     Return values are 0 or positive numbers only (by definition).
     '''
-    if not mn or not mx:
+    if mn is None or mx is None:
         mn, mx = bounding_box(solid)
 
     return [abs(big - small) for small, big in zip(mn, mx)]
@@ -212,7 +306,11 @@ def z_height(solid, mn = None, mx = None):
     Optionally: supply mn and mx to avoid recomputing bounding box. See bounding_box() for more details.
     0 or positive numbers only (by definition).
     '''
-    return magnitudes(solid, mn, mx)[-1]
+    if mn is None or mx is None:
+        mn, mx = bounding_box(solid)
+
+    # Only z is needed. Skip building all three magnitudes.
+    return abs(mx[2] - mn[2])
 
 def z_stack(*solids_with_z_deltas):
     '''
@@ -229,28 +327,26 @@ def z_stack(*solids_with_z_deltas):
         agg_height += (z_h + z_delta)
     return res
 
-def z_bisect(solid, top_mask=None, epsilon=0.001):
+def z_bisect(solid, top_mask=None, epsilon=0.001, mn = None, mx = None):
     '''
     Horizontal chop, given (optional) top mask.
     If top mask is unspecified, xy-plane is used as the cut line.
     Return [top, bottom] after cut.
+
+    Optionally: supply mn and mx to avoid recomputing bounding box. Only used when top_mask is unspecified.
     '''
     if not top_mask:
         # Just need the xy dimensions.
-        mn, mx = bounding_box(solid)
+        if mn is None or mx is None:
+            mn, mx = bounding_box(solid)
 
         if any(not coord for coord in (mn, mx)):
             # defensive check if there's nothing to z_bisect because solid does not span across Z plane
             raise ValueError(f"arg solid does not span across Z axis. Therefore, nothing to z_bisect(). Bounding boxes found: {mn=}, {mx=}")
 
-        # Clock wise points
-        xy_points = [
-            [p - epsilon for p in mn[:2]],   # lower left
-            [mn[0] - epsilon, mx[1] + epsilon],
-            [p + epsilon for p in mx[:2]],   # upper right
-            [mx[0] + epsilon, mn[1] - epsilon]
-        ]
-        top_mask = polygon(xy_points).linear_extrude(mx[2])
+        # xy footprint of the bounding box padded by epsilon on every side, from z=0 up to the top.
+        # A cube primitive, rather than polygon() + linear_extrude().
+        top_mask = cube([mx[0] - mn[0] + 2 * epsilon, mx[1] - mn[1] + 2 * epsilon, mx[2]]).translate([mn[0] - epsilon, mn[1] - epsilon, 0])
 
     top = solid & top_mask
 
@@ -267,11 +363,13 @@ def y_bisect(solid, epsilon=0.001):
     left, right = [item.roty(-90) for item in (left, right)]
     return [left, right]
 
-def z_donut_hole(donut):
+def z_donut_hole(donut, mn = None, mx = None):
     '''
     You have a donut. You want the donut hole.
+
+    Optionally: supply mn and mx to avoid recomputing bounding box. See bounding_box() for more details.
     '''
-    mask_cube = bounding_box_cube(donut)
+    mask_cube = bounding_box_cube(donut, mn, mx)
     outer = hull(donut)
 
     # intersect the hull(donut) to cut out all the extra crap from bounding box cube.
@@ -279,20 +377,26 @@ def z_donut_hole(donut):
     return res
 
 
-def z_hammer_hull_union(top_solid, bottom_solid, full_pierce=False):
+def z_hammer_hull_union(top_solid, bottom_solid, full_pierce=False, mn = None, mx = None):
     '''
     Top solid "presses" into the bottom solid, and unioned.
     Simple put: top_solid | (bottom_solid - hull(top_solid))
     Example: donut + box = preserve the Donut's hole.
 
     Optional: full_pierce = True means the "hole punching" to bottom_solid would be a projection(hull(top_solid)) in the Z direction.
+    Optionally: supply mn and mx (of bottom_solid) to avoid recomputing bounding box. Only used when full_pierce = True.
     '''
+    # Hull once: full_pierce needs it for the punch, and the final cut needs it again.
+    top_hull = hull(top_solid)
+
     if full_pierce:
-        bottom_solid_height = z_height(bottom_solid)
-        mn, _ = bounding_box(bottom_solid)
+        # One bounding box serves both the height and the below-ground check.
+        if mn is None or mx is None:
+            mn, mx = bounding_box(bottom_solid)
+        bottom_solid_height = z_height(bottom_solid, mn, mx)
 
         # Create a hole punch to bottom_solid, use projection(hull(top_solid) thru the height of bottom_solid.
-        hole_punch = projection(hull(top_solid)).linear_extrude(bottom_solid_height)
+        hole_punch = projection(top_hull).linear_extrude(bottom_solid_height)
 
         # Since we are full_piercing: If there's "below ground" volume, translate the hole_punch accordingly.
         if mn[-1] < 0:
@@ -300,19 +404,17 @@ def z_hammer_hull_union(top_solid, bottom_solid, full_pierce=False):
 
         bottom_solid -= hole_punch
 
-    return top_solid | (bottom_solid - hull(top_solid))
+    return top_solid | (bottom_solid - top_hull)
 
 def rolling_hull(solid, path):
     '''
     Returned the object formed by the shadow left by rolling the solid along all the coordinates on the path.
     '''
     template = center(solid)[0]
-    whole_path = []
-    vertices = []
-    for coord in path:
-        vertices.append(template.translate(coord))
-        if len(vertices) >= 2:
-            whole_path.append(hull(vertices[-1], vertices[-2]))
+    vertices = [template.translate(coord) for coord in path]
+
+    # Hull every consecutive pair, and union them in one n-ary call.
+    whole_path = [hull(a, b) for a, b in zip(vertices, vertices[1:])]
 
     return [union(whole_path)] + vertices
 
@@ -323,13 +425,10 @@ def rolling_filled_hull(solid, path):
     NOTE: This differ from rolling_hull by filling in the concaved cavity. This makes a HARD assumption path given forms a enclosed shape and points are given in linear-path order (think hexagon in clockwise or counterclockwise order).
     '''
     template = center(solid)[0]
-    whole_path = []
-    vertices = []
-    for coord in path:
-        vertices.append(template.translate(coord))
-        
-        if len(vertices) >= 3:
-            whole_path.append(hull(vertices[-1], vertices[-2], vertices[-3]))
+    vertices = [template.translate(coord) for coord in path]
+
+    # Hull every run of 3 consecutive vertices, and union them in one n-ary call.
+    whole_path = [hull(a, b, c) for a, b, c in zip(vertices, vertices[1:], vertices[2:])]
 
     return [union(whole_path)] + vertices
 
@@ -353,7 +452,9 @@ def masked_map(mask, solid, func=lambda shape: shape.scale([0.5, 0.5, 1]), auto_
     Returns [Apply(operating_vol), operating_vol, untouched ]. This generic form supports cases where func may be splitting the solid into multiple solids.
     '''
     operating_vol = solid & mask
-    untouched = solid - operating_vol
+
+    # solid - (solid & mask) is the same volume as solid - mask, without nesting the intersection inside the difference.
+    untouched = solid - mask
 
     if auto_center:
         # Move masked shape to center before executing.
@@ -406,8 +507,8 @@ def dist(coord_left, coord_right):
     distance between two coordinates. Works for 2d or 3d.
     Used to be called line_magnitude().
     '''
-    components = [(dim_right - dim_left) ** 2 for dim_left, dim_right in zip(coord_left, coord_right)]
-    return sum(components) ** 0.5
+    # math.hypot() takes any number of components (Python 3.8+), and avoids overflow/underflow of the squares.
+    return math.hypot(*(dim_right - dim_left for dim_left, dim_right in zip(coord_left, coord_right)))
 
 # def midpoint(point_left, point_right):
 #     x1, y1 = point_left
@@ -476,11 +577,22 @@ def rotate_point_horizontal(pt, angle_offset_deg):
     Utility for rotating a point (x, y, z) in respect to origin on the xy plane.
     '''
     x, y, z = pt
-    nx = x * math.cos(math.radians(angle_offset_deg)) - y * math.sin(math.radians(angle_offset_deg))
-    ny = x * math.sin(math.radians(angle_offset_deg)) + y * math.cos(math.radians(angle_offset_deg))
+    angle = math.radians(angle_offset_deg)
+    c, s = math.cos(angle), math.sin(angle)
+    nx = x * c - y * s
+    ny = x * s + y * c
     nz = z
     return [nx, ny, nz]
 
+def rotate_points_horizontal(pts, angle_offset_deg):
+    '''
+    Batch version of rotate_point_horizontal(): rotate every point (x, y, z) in respect to origin on the xy plane.
+    The sin/cos are computed once for the whole batch.
+    '''
+    angle = math.radians(angle_offset_deg)
+    c, s = math.cos(angle), math.sin(angle)
+    return [[x * c - y * s, x * s + y * c, z] for x, y, z in pts]
+
 def add_single_brim(convex_solid, scale_factor=1.2, height=0.2):
     '''
     Assume solid is already z-aligned.
@@ -507,12 +619,11 @@ def debug_find_face_by_minimum_dist(solid, coordinate, num_faces=1):
 
     def iterate_faces():
         for idx, f in enumerate(solid.faces()):
-            # Since face is not actually a solid: hack it by "attaching" a dummy solid center to the face.
-            dummy = cube(1, center='000').multmatrix(f.matrix)
-            _, move_vec = center(dummy)
-            move_from_origin_to_face = [-dim for dim in move_vec]
+            # The face's center is the translation component of its 4x4 matrix.
+            # Same point a dummy cube(1, center='000').multmatrix(f.matrix) would center on, without building and meshing one per face.
+            move_from_origin_to_face = to_translation_vector(f.matrix)
 
-            # rank by dist from face (proxy by dummy cube(1)) and arg coordinate
+            # rank by dist from face center and arg coordinate
             yield (f, idx, dist(move_from_origin_to_face, coordinate))
     
     best_matched_faces = heapq.nsmallest(num_faces, iterate_faces(), key=lambda tup: tup[2])
@@ -531,37 +642,30 @@ def debug_find_face_by_normal_vector(solid, estimated_norm_vec, num_faces=1):
     XXX: This is not really usable in practice. Easier to find a face based on dist to a point.
     '''
 
-    def transformation_matrix_to_normal_vector(trans_matrix):
-        '''
-        Discovered this by observation via debugging.
-        f.matrix from faces() -> 3rd column = normal vector.
-        '''
-        return [row[2] for row in trans_matrix[:3]]
-
-    def dist(x_mag, y_mag, z_mag):
-        '''
-        Get scalar of the magnitude between 2 vectors.
-        '''
-        return math.sqrt(x_mag ** 2 + y_mag ** 2 + z_mag ** 2)
+    ex, ey, ez = estimated_norm_vec
 
     def iterate_faces():
         '''
         Helper function to preprocess the items we need for evaluating faces in ranked order closest to arg estimated_norm_vec.
         '''
         for idx, f in enumerate(solid.faces()):
-            face_normal_vector = transformation_matrix_to_normal_vector(f.matrix)
-            d = dist(*magnitudes(None, mn=face_normal_vector, mx=estimated_norm_vec))
-            # (face, idx, magnitude dist between estimated_norm_vec and face's norm vec)
-            yield (f, idx, d)
+            # Discovered this by observation via debugging.
+            # f.matrix from faces() -> 3rd column = normal vector.
+            m = f.matrix
+            dx, dy, dz = m[0][2] - ex, m[1][2] - ey, m[2][2] - ez
+            # (face, idx, SQUARED magnitude dist between estimated_norm_vec and face's norm vec)
+            # sqrt is monotonic: ranking on the squared dist gives the same order.
+            yield (f, idx, dx * dx + dy * dy + dz * dz)
 
-    best_matched_faces = heapq.nsmallest(num_faces, iterate_faces(), key=lambda tup: tup[2])
+    # Only the kept matches need the actual dist.
+    best_matched_faces = [(f, idx, math.sqrt(d2)) for f, idx, d2 in heapq.nsmallest(num_faces, iterate_faces(), key=lambda tup: tup[2])]
 
     # Reformat the output to list of 3 lists: [faces], [index], [dist].
     # It's a simple transpose. Need to deref the tuples to flatten before rewrap as lists. Both arg to zip, and zip's output (which default to tuple).
     return [[*dim] for dim in zip(*best_matched_faces)]
 
 
-def debug_face_indicators(solid, indicator = sphere(0.5), indicator_color = 'yellow'):
+def debug_face_indicators(solid, indicator = sphere(0.5), indicator_color = 'yellow', mesh = None):
     '''
     XXX: this uses solid.mesh(), which the order of items return is NOT THE SAME as solid.faces().
     
@@ -575,33 +679,44 @@ def debug_face_indicators(solid, indicator = sphere(0.5), indicator_color = 'yel
     Since a solid can have MANY vertices: use itertools.islice() to efficency loop thru faces without pre-storing all the vertices x indicators.
 
     Note: Each generator yield is a list of indicator shapes, in which displayed together shows the vertices of a face.
+
+    Optionally: supply mesh (as returned by solid.mesh() or get_mesh()) to avoid evaluating it again.
     '''
     # Vertex is your (x, y, z) coordinate.
     # Faces is a list of arrays, where each array are index pointers to a specific vertex.
     # A face would comprise of at least 3 vertices.
 
-    for coords in debug_face_coordinates(solid):
+    vertices, faces = get_mesh(solid) if mesh is None else mesh
+
+    # Color once. Translating a colored indicator is the same as coloring each translated one.
+    colored_indicator = indicator.color(indicator_color)
+
+    # Neighboring faces share vertices. Build one indicator per vertex index, and reuse it across faces.
+    dots_by_vertex = {}
+    for vertex_indices in faces:
         dots = []
-        for xyz in coords:
-            dots.append(indicator.translate(xyz).color(indicator_color))
+        for vertex_idx in vertex_indices:
+            dot = dots_by_vertex.get(vertex_idx)
+            if dot is None:
+                dot = dots_by_vertex[vertex_idx] = colored_indicator.translate(vertices[vertex_idx])
+            dots.append(dot)
         yield dots
 
-def debug_face_coordinates(solid):
+def debug_face_coordinates(solid, mesh = None):
     '''
     mesh() returns face in the form of index pointers to vertices.
     This is a convenience function to return a generator of list of xyz coordinates to avoid the extra level of dereferencing.
     For usability reasons only.
+
+    Optionally: supply mesh (as returned by solid.mesh() or get_mesh()) to avoid evaluating it again.
     '''
     # Vertex is your (x, y, z) coordinate.
     # Faces is a list of arrays, where each array are index pointers to a specific vertex.
     # A face would comprise of at least 3 vertices.
-    vertices, faces = solid.mesh()
+    vertices, faces = get_mesh(solid) if mesh is None else mesh
 
     for vertex_indices in faces:
-        coords = []
-        for vertex_idx in vertex_indices:
-            coords.append(vertices[vertex_idx])
-        yield coords
+        yield [vertices[vertex_idx] for vertex_idx in vertex_indices]
 
 
     
@@ -698,7 +813,7 @@ def offset_3d_withdelta(solid, delta = [1, 1, 1], auto_center=True, mn = None, m
     EXPERIMENTAL FOR TESTING: ResultWithDelta variant of offset_3d in ztools.
     '''
     res = offset_3d(solid, delta, auto_center, mn, mx)
-    return TransformLineageMonad.ResultWithDelta(res, cube(1).origin, [res])
+    return TransformLineageMonad.ResultWithDelta(res, IDENTITY4, [res])
     
 def center_withdelta(solid, axis = [1, 1, 1], mn = None, mx = None):
     '''
@@ -730,22 +845,21 @@ def projection_withdelta(solid):
     We can override the component transform matrix with identity matrix (noop movement).
     '''
     replacement = projection(solid)
-    return TransformLineageMonad.ResultWithDelta(replacement, cube(1).origin, [replacement])
+    return TransformLineageMonad.ResultWithDelta(replacement, IDENTITY4, [replacement])
     
 def rotate_extrude_withdelta(solid, angle):
     '''
     rotate_extrude makes origin the "center" of the result solid, but origin is set to identity matrix.
     
-    use center() move_vec as the delta translation matrix.
+    use the xy bounding box center (what center() would move by) as the delta translation matrix.
     '''
     res = solid.rotate_extrude(angle)
     
-    # center and axis_aligned only works on 3d solids. Raise the height to make it 3d to generate the delta transform matrix.
-    tmp = solid.linear_extrude(1)
-    tmp, move_vec = center(tmp, axis=[1, 1, 0])
-    _, move_vec2 = axis_aligned(tmp, axis=[0, 0, 1])
+    # bounding_box only works on 3d solids. Raise the height to make it 3d, only to read its xy extents.
+    mn, mx = bounding_box(solid.linear_extrude(1))
     
-    delta = multmatrix(to_matrix(move_vec), to_matrix(move_vec2))
+    # The delta is the pure translation centering the solid on xy. Extrusion starts at z=0, so no z component.
+    delta = to_matrix([-(mn[0] + mx[0]) / 2, -(mn[1] + mx[1]) / 2, 0])
     return TransformLineageMonad.ResultWithDelta(res, delta, [res])
 
 def wrap_withdelta(solid, r):
@@ -802,10 +916,13 @@ class LappedCuts:
         # Finishing detail: Shape the dovetail to be flushed with the input solid.
         locks = [mask & solid for mask in lock_mask_list]
         
-        # Only used if symmetry=True.
-        reverse_locks = [lock_mask & solid.right(base_offset).roty(180) for lock_mask in locks]
-        # Restore orientation.
-        reverse_locks = [reverse_lock.roty(180).left(base_offset) for reverse_lock in reverse_locks]
+        # Only used if symmetry=True. Skip building them otherwise.
+        reverse_locks = []
+        if symmetry:
+            # Mirror the solid once, shared by every lock.
+            base_rot = solid.right(base_offset).roty(180)
+            # Restore orientation.
+            reverse_locks = [(lock_mask & base_rot).roty(180).left(base_offset) for lock_mask in locks]
 
         
         # Preprocessing to hollow out where dovetail would sit.